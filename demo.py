@@ -1,10 +1,9 @@
 """Demo script showing the workout planner in action."""
 
-import json
 import random
-from datetime import date
-from pathlib import Path
+from datetime import date, timedelta
 
+from services._configcache import load_json
 from services.class_roster import ClassRosterService, DummyAttendanceService
 from services.weather import OpenMeteoWeatherService
 from services.workout_planner import WorkoutPlannerService
@@ -38,13 +37,7 @@ def main():
     # 4) Print class info + weekly overview
 
     # Load class configs directly so we preserve multiple entries per day
-    classes_cfg = []
-    cfgp = Path("configs/classes.json")
-    if cfgp.exists():
-        try:
-            classes_cfg = json.loads(cfgp.read_text(encoding="utf-8"))
-        except Exception:
-            classes_cfg = []
+    classes_cfg = load_json("configs/classes.json") or []
 
     if not classes_cfg:
         print("No class configurations found in configs/classes.json")
@@ -54,13 +47,8 @@ def main():
     chosen = rng.choice(classes_cfg)
 
     # Load students pool
-    students_pool = []
-    sp = Path("configs/students.json")
-    if sp.exists():
-        try:
-            students_pool = json.loads(sp.read_text(encoding="utf-8"))
-        except Exception:
-            students_pool = []
+    # Copy, since the pool is shuffled in place below
+    students_pool = list(load_json("configs/students.json") or [])
 
     # pick number of students
     attendees = []
@@ -75,13 +63,7 @@ def main():
         attendees = students_pool[:n]
 
     # pick a random routine
-    routines = {}
-    rpath = Path("configs/routines.json")
-    if rpath.exists():
-        try:
-            routines = json.loads(rpath.read_text(encoding="utf-8"))
-        except Exception:
-            routines = {}
+    routines = load_json("configs/routines.json") or {}
 
     routine_key = None
     routine = None
@@ -119,17 +101,13 @@ def main():
     print("\nWeekly Overview (Dec 1-7, 2025):\n")
     base_date = date(2025, 12, 1)
     for i in range(7):
-        current_date = date(base_date.year, base_date.month, base_date.day + i)
+        current_date = base_date + timedelta(days=i)
+        day_name = current_date.strftime("%A")
         plan = planner.generate_plan(
             current_date, chosen_location or "Huntington Beach"
         )
-        day_name = current_date.strftime("%A")
         routine_name = plan.routine.name
-        present_members = (
-            sum(1 for m in plan.class_session.roster if m.status == "Present")
-            if plan.class_session
-            else 0
-        )
+        present_members = plan.class_session.present_count if plan.class_session else 0
         print(
             f"{day_name:10} | {routine_name:25} | Attendance: {present_members:2} | Duration: {plan.routine.duration_minutes:3} min | Intensity: {plan.routine.intensity:6}"
         )
@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+from functools import cache
+from pathlib import Path
+from typing import Any
+
+try:
+    from orjson import loads as json_loads
+except ImportError:  # orjson is optional; stdlib json also accepts bytes
+    from json import loads as json_loads
+
+
+@cache
+def load_json(path: str) -> Any:
+    """Parse a JSON config file once per process.
+
+    Returns None if the file is missing or cannot be parsed. The parsed object
+    is shared between callers, so treat it as read-only.
+    """
+    cfg = Path(path)
+    if not cfg.exists():
+        return None
+    try:
+        return json_loads(cfg.read_bytes())
+    except Exception:
+        return None
@@ -1,25 +1,35 @@
 from __future__ import annotations
 
-import json
 import random
-from dataclasses import dataclass
+import threading
+from dataclasses import dataclass, field
 from datetime import date
 from pathlib import Path
 
+from services._configcache import load_json
+from services.weekdays import WEEKDAY_INDEX
 
-@dataclass
+
+@dataclass(slots=True)
 class ClassMember:
     name: str
     status: str  # "Present", "Absent", "Excused"
 
 
-@dataclass
+@dataclass(slots=True)
 class ClassSession:
     day: str  # Monday, Tuesday, etc.
     class_name: str
     time: str
     roster: list[ClassMember]
     location: str | None = None
+    # Attendance counts are derived from the roster once at construction
+    present_count: int = field(init=False)
+    total_count: int = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.present_count = sum(1 for m in self.roster if m.status == "Present")
+        self.total_count = len(self.roster)
 
 
 class ClassRosterService:
@@ -43,15 +53,31 @@ class ClassRosterService:
     ) -> None:
         # Attendance service that will provide dynamic rosters
         self.attendance_service = attendance_service or DummyAttendanceService()
-
+        # If no config_path provided, try default location 'configs/classes.json'
+        self.config_path = Path(config_path or "configs/classes.json")
+
+        # Rosters are built on first lookup, not at construction
+        self.ROSTERS: dict[str, ClassSession] = {}
+        self._rosters_by_wd: list[ClassSession | None] = [None] * 7
+        self._loaded = False
+        self._load_lock = threading.Lock()
+
+    def _ensure_loaded(self) -> None:
+        if self._loaded:
+            return
+        # Planner calls may arrive from several threads; build rosters once
+        with self._load_lock:
+            if self._loaded:
+                return
+            self._build_rosters()
+            self._loaded = True
+
+    def _build_rosters(self) -> None:
         # Load class configs either from provided JSON or defaults
         classes = {}
-        # If no config_path provided, try default location 'configs/classes.json'
-        cfg_path = config_path or "configs/classes.json"
-        path = Path(cfg_path)
-        if path.exists():
+        data = load_json(str(self.config_path))
+        if data:
             try:
-                data = json.loads(path.read_text(encoding="utf-8"))
                 for entry in data:
                     day = entry.get("day")
                     if not day:
@@ -83,6 +109,12 @@ class ClassRosterService:
 
         self.ROSTERS = rosters
 
+        # Index sessions by `date.weekday()` so date lookups skip strftime
+        for day, session in rosters.items():
+            idx = WEEKDAY_INDEX.get(day)
+            if idx is not None:
+                self._rosters_by_wd[idx] = session
+
     def get_roster_for_day(self, day_name: str) -> ClassSession | None:
         """Get the class roster for a specific day.
 
@@ -92,6 +124,7 @@ class ClassRosterService:
         Returns:
             ClassSession or None if day not found
         """
+        self._ensure_loaded()
         return self.ROSTERS.get(day_name)
 
     def get_roster_for_date(self, target_date: date) -> ClassSession | None:
@@ -103,11 +136,12 @@ class ClassRosterService:
         Returns:
             ClassSession or None if day not found
         """
-        day_name = target_date.strftime("%A")
-        return self.get_roster_for_day(day_name)
+        self._ensure_loaded()
+        return self._rosters_by_wd[target_date.weekday()]
 
     def get_all_rosters(self) -> dict[str, ClassSession]:
         """Get all class rosters."""
+        self._ensure_loaded()
         return self.ROSTERS.copy()
 
     def get_present_members(self, day_name: str) -> list[ClassMember]:
@@ -122,17 +156,12 @@ class DummyStudentDirectory:
     """Simple directory of possible students loaded from `configs/students.json` if available."""
 
     @classmethod
-    def load_students(cls, path: str | None = None) -> list[str]:
-        cfg = Path(path or "configs/students.json")
-        if cfg.exists():
-            try:
-                data = json.loads(cfg.read_text(encoding="utf-8"))
-                if isinstance(data, list) and all(isinstance(x, str) for x in data):
-                    return data
-            except Exception:
-                return []
-        # No hardcoded defaults; return empty list if file missing or invalid
-        return []
+    def load_students(cls, path: str | None = None) -> tuple[str, ...]:
+        data = load_json(path or "configs/students.json")
+        if isinstance(data, list) and all(isinstance(x, str) for x in data):
+            return tuple(data)
+        # No hardcoded defaults; return empty tuple if file missing or invalid
+        return ()
 
 
 class DummyAttendanceService:
@@ -144,20 +173,19 @@ class DummyAttendanceService:
 
     def __init__(self, seed: int = 42, students_path: str | None = None) -> None:
         self.rand = random.Random(seed)
-        self.pool = DummyStudentDirectory.load_students(students_path)
+        self.pool: tuple[str, ...] = DummyStudentDirectory.load_students(students_path)
 
     def get_attendees(
         self, *, class_name: str, day: str | None = None, location: str | None = None
     ) -> list[ClassMember]:
-        pool = self.pool.copy()
         # handle small pools gracefully
-        if len(pool) == 0:
+        if len(self.pool) == 0:
             return []
-        if len(pool) == 1:
-            return [ClassMember(name=pool[0], status="Present")]
+        if len(self.pool) == 1:
+            return [ClassMember(name=self.pool[0], status="Present")]
 
-        max_n = min(16, len(pool))
+        max_n = min(16, len(self.pool))
         n = self.rand.randint(2, max_n)
-        self.rand.shuffle(pool)
-        selected = pool[:n]
+        # sample draws n names without copying or shuffling the whole pool
+        selected = self.rand.sample(self.pool, k=n)
         return [ClassMember(name=name, status="Present") for name in selected]
@@ -1,11 +1,38 @@
 from __future__ import annotations
 
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 
 import requests
-
-
-@dataclass(frozen=True)
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+def _describe_code(code: float) -> str:
+    # Simplified mapping of Open-Meteo weather codes
+    if code == 0:
+        return "Clear"
+    if code in (1, 2, 3):
+        return "Mainly clear / partly cloudy"
+    if code in (45, 48):
+        return "Fog"
+    if 51 <= code <= 67:
+        return "Drizzle / Rain"
+    if 71 <= code <= 77:
+        return "Snow / Ice"
+    if 80 <= code <= 82:
+        return "Rain showers"
+    if 95 <= code <= 99:
+        return "Thunderstorm"
+    return f"Weather code {code}"
+
+
+# Integer codes are served from this table; other values use _describe_code
+_WEATHER_DESCRIPTIONS = tuple(_describe_code(code) for code in range(100))
+
+
+@dataclass(frozen=True, slots=True)
 class WindForcast:
     location: str
     wind_speed_mps: float
@@ -22,35 +49,111 @@ class OpenMeteoWeatherService:
     the current weather (temperature and wind speed). Gusts are not always
     provided by the simple current weather response, so `wind_gust_mps` may
     be None.
+
+    Geocoding results are cached per location string for the lifetime of the
+    service, and forecasts are cached per coordinate for `FORECAST_TTL_SECONDS`.
     """
 
     GEOCODING_URL = "https://geocoding-api.open-meteo.com/v1/search"
     FORECAST_URL = "https://api.open-meteo.com/v1/forecast"
+    FORECAST_TTL_SECONDS = 600
+    # (connect, read) timeouts so a hung endpoint fails fast
+    REQUEST_TIMEOUT = (2, 5)
+    # Clock used for forecast expiry; tests may override it per instance
+    _clock = time.monotonic
 
     def __init__(self, session: requests.Session | None = None) -> None:
-        self.session = session or requests.Session()
+        if session is None:
+            session = requests.Session()
+            # Keep-alive pool sized for bursts of calls, with retries on
+            # transient upstream failures
+            adapter = HTTPAdapter(
+                pool_connections=4,
+                pool_maxsize=16,
+                max_retries=Retry(
+                    total=2,
+                    backoff_factor=0.1,
+                    status_forcelist=[429, 500, 502, 503, 504],
+                ),
+            )
+            session.mount("https://geocoding-api.open-meteo.com", adapter)
+            session.mount("https://api.open-meteo.com", adapter)
+        self.session = session
+        # location -> (latitude, longitude, resolved name)
+        self._geo_cache: dict[str, tuple[float, float, str]] = {}
+        # (latitude, longitude) -> (monotonic timestamp, forecast)
+        self._forecast_cache: dict[tuple[float, float], tuple[float, WindForcast]] = {}
+        # Pool for concurrent geocoding lookups (at most four location forms);
+        # threads start on demand. Released by `close()`.
+        self._executor = ThreadPoolExecutor(max_workers=4)
+
+    def close(self) -> None:
+        """Stop the geocoding pool. The HTTP session is left to its owner."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _geocode(self, location: str) -> tuple[float, float, str] | None:
+        cached = self._geo_cache.get(location)
+        if cached is not None:
+            return cached
+
+        # Try several sanitized forms of the location to improve geocoding,
+        # most specific first
+        candidates = list(
+            dict.fromkeys(
+                [
+                    location,
+                    location.split("(")[0].strip(),
+                    location.split("-")[0].strip(),
+                    location.split(",")[0].strip(),
+                ]
+            )
+        )
+        place = self._first_geocode_match(candidates)
+        if not place:
+            return None
+        geo = (
+            place.get("latitude"),
+            place.get("longitude"),
+            place.get("name") or location,
+        )
+        self._geo_cache[location] = geo
+        return geo
+
+    def _first_geocode_match(self, candidates: list[str]) -> dict | None:
+        """Look up every candidate at once and return the first match in order.
+
+        Results are taken in preference order, not completion order, so the
+        most specific form that resolves wins. Queued lookups are cancelled once
+        a match is found; lookups already in flight finish and are ignored.
+        """
+        futures = [
+            self._executor.submit(self._geocode_candidate, candidate)
+            for candidate in candidates
+        ]
+        try:
+            for future in futures:
+                place = future.result()
+                if place:
+                    return place
+            return None
+        finally:
+            for future in futures:
+                future.cancel()
+
+    def _geocode_candidate(self, candidate: str) -> dict | None:
+        params = {"name": candidate, "count": 1}
+        r = self.session.get(
+            self.GEOCODING_URL, params=params, timeout=self.REQUEST_TIMEOUT
+        )
+        r.raise_for_status()
+        data = r.json()
+        results = data.get("results") or []
+        return results[0] if results else None
 
     def get_wind_forecast(self, location: str) -> WindForcast:
         # 1) Geocode the location
-        # Try several sanitized forms of the location to improve geocoding
-        candidates = [
-            location,
-            location.split("(")[0].strip(),
-            location.split("-")[0].strip(),
-            location.split(",")[0].strip(),
-        ]
-        place = None
-        for candidate in candidates:
-            params = {"name": candidate, "count": 1}
-            r = self.session.get(self.GEOCODING_URL, params=params, timeout=10)
-            r.raise_for_status()
-            data = r.json()
-            results = data.get("results") or []
-            if results:
-                place = results[0]
-                break
-
-        if not place:
+        geo = self._geocode(location)
+        if not geo:
             # fallback: return empty/default forecast
             return WindForcast(
                 location=location,
@@ -59,9 +162,13 @@ class OpenMeteoWeatherService:
                 description="Unknown",
                 temperature_celsius=None,
             )
-        lat = place.get("latitude")
-        lon = place.get("longitude")
-        name = place.get("name") or location
+        lat, lon, name = geo
+
+        cached = self._forecast_cache.get((lat, lon))
+        if cached is not None:
+            fetched_at, forecast = cached
+            if self._clock() - fetched_at < self.FORECAST_TTL_SECONDS:
+                return forecast
 
         # 2) Query current weather
         fp = {
@@ -70,7 +177,9 @@ class OpenMeteoWeatherService:
             "current_weather": True,
             "timezone": "auto",
         }
-        fr = self.session.get(self.FORECAST_URL, params=fp, timeout=10)
+        fr = self.session.get(
+            self.FORECAST_URL, params=fp, timeout=self.REQUEST_TIMEOUT
+        )
         fr.raise_for_status()
         payload = fr.json()
         current = payload.get("current_weather") or {}
@@ -83,31 +192,20 @@ class OpenMeteoWeatherService:
 
         description = self._describe_weathercode(weathercode)
 
-        return WindForcast(
+        forecast = WindForcast(
             location=name,
             wind_speed_mps=wind_speed if wind_speed is not None else 0.0,
             wind_gust_mps=wind_gust,
             description=description,
             temperature_celsius=temp,
         )
+        self._forecast_cache[(lat, lon)] = (self._clock(), forecast)
+        return forecast
 
     @staticmethod
     def _describe_weathercode(code: int | None) -> str:
+        if isinstance(code, int) and 0 <= code < len(_WEATHER_DESCRIPTIONS):
+            return _WEATHER_DESCRIPTIONS[code]
         if code is None:
             return "No description available"
-        # Simplified mapping of Open-Meteo weather codes
-        if code == 0:
-            return "Clear"
-        if code in (1, 2, 3):
-            return "Mainly clear / partly cloudy"
-        if code in (45, 48):
-            return "Fog"
-        if 51 <= code <= 67:
-            return "Drizzle / Rain"
-        if 71 <= code <= 77:
-            return "Snow / Ice"
-        if 80 <= code <= 82:
-            return "Rain showers"
-        if 95 <= code <= 99:
-            return "Thunderstorm"
-        return f"Weather code {code}"
+        return _describe_code(code)
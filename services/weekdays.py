@@ -0,0 +1,13 @@
+from __future__ import annotations
+
+# Weekday names in `date.weekday()` order, shared by the routine and roster services
+WEEKDAYS = (
+    "Monday",
+    "Tuesday",
+    "Wednesday",
+    "Thursday",
+    "Friday",
+    "Saturday",
+    "Sunday",
+)
+WEEKDAY_INDEX = {day: i for i, day in enumerate(WEEKDAYS)}
@@ -1,26 +1,64 @@
 from __future__ import annotations
 
+import time
 from dataclasses import dataclass
 from datetime import date
+from functools import lru_cache
 
 from services.class_roster import ClassRosterService, ClassSession
 from services.weather import OpenMeteoWeatherService, WindForcast
+from services.weekdays import WEEKDAYS
 from services.workout_routine import WorkoutRoutine, WorkoutRoutineService
 
+# Adjustment messages with no per-plan content
+_RAIN_MSG = "🌧️ Rainy conditions - ensure proper footwear and safety"
+_GOOD_WEATHER_MSG = "☀️ Great weather - consider outdoor cardio session"
+_HIGH_INTENSITY_MSG = (
+    "💪 High intensity workout - ensure adequate hydration and recovery"
+)
+_OPTIMAL_MSG = "✨ Optimal conditions - proceed with standard routine"
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class WorkoutPlan:
     date: str
     routine: WorkoutRoutine
     wind_forecast: WindForcast
     class_session: ClassSession | None
-    recommended_adjustments: list[str]
+    recommended_adjustments: tuple[str, ...]
     plan_summary: str
 
 
 class WorkoutPlannerService:
     """Service that generates a daily workout plan based on weather, routine, and class roster."""
 
+    # Adjustment thresholds
+    HIGH_WIND_MPS = 10
+    MOD_WIND_MPS = 5
+    HOT_C = 30
+    COLD_C = 5
+
+    # Cached plans embed a forecast, so they expire with it
+    PLAN_TTL_SECONDS = OpenMeteoWeatherService.FORECAST_TTL_SECONDS
+    # Clock used for plan expiry; tests may override it per instance
+    _clock = time.monotonic
+
+    # Static layout of the routine and weather sections of the plan summary
+    _SUMMARY_HEADER = "\n".join(
+        [
+            "📅 Daily Workout Plan - {day_name}",
+            "=" * 50,
+            "\n🏋️ Routine: {routine.name}",
+            "   Duration: {routine.duration_minutes} minutes",
+            "   Intensity: {routine.intensity}",
+            "   Exercises: {routine.exercises_csv}",
+            "\n🌍 Weather ({wind_forecast.location}):",
+            "   Wind Speed: {wind_forecast.wind_speed_mps} m/s",
+            "   Description: {wind_forecast.description}",
+            "   Temperature: {wind_forecast.temperature_celsius} °C",
+        ]
+    )
+
     def __init__(
         self,
         weather_service: OpenMeteoWeatherService,
@@ -30,10 +68,15 @@ class WorkoutPlannerService:
         self.weather_service = weather_service
         self.routine_service = routine_service
         self.roster_service = roster_service
+        # Per-instance plan cache keyed by (ISO date, location, TTL window)
+        self._generate_plan_cached = lru_cache(maxsize=64)(self._build_plan)
 
     def generate_plan(self, target_date: date, location: str) -> WorkoutPlan:
         """Generate a comprehensive workout plan for a specific date.
 
+        Plans are cached per (date, location) for at most `PLAN_TTL_SECONDS`;
+        call `clear_cache()` to force fresh weather and roster data sooner.
+
         Args:
             target_date: The date to generate the plan for
             location: The location for weather data
@@ -41,8 +84,17 @@ class WorkoutPlannerService:
         Returns:
             WorkoutPlan: A complete workout plan with adjustments
         """
-        # Get day name
-        day_name = target_date.strftime("%A")
+        ttl_window = int(self._clock() // self.PLAN_TTL_SECONDS)
+        return self._generate_plan_cached(target_date.isoformat(), location, ttl_window)
+
+    def clear_cache(self) -> None:
+        """Drop all cached plans."""
+        self._generate_plan_cached.cache_clear()
+
+    def _build_plan(self, iso_date: str, location: str, ttl_window: int) -> WorkoutPlan:
+        # ttl_window only partitions the cache key; it is not used here
+        target_date = date.fromisoformat(iso_date)
+        day_name = WEEKDAYS[target_date.weekday()]
 
         # Fetch routine and class session first
         routine = self.routine_service.get_routine_for_date(target_date)
@@ -51,7 +103,7 @@ class WorkoutPlannerService:
         # Determine weather location: prefer class location if available
         weather_location = (
             class_session.location
-            if (class_session and getattr(class_session, "location", None))
+            if (class_session and class_session.location)
             else location
         )
 
@@ -62,19 +114,27 @@ class WorkoutPlannerService:
             raise ValueError(f"No routine found for {day_name}")
 
         # Generate recommended adjustments based on conditions
-        adjustments = self._generate_adjustments(routine, wind_forecast, class_session)
+        adjustments, present_count, total_count = self._generate_adjustments(
+            routine, wind_forecast, class_session
+        )
 
         # Create plan summary
         plan_summary = self._create_summary(
-            day_name, routine, wind_forecast, class_session, adjustments
+            day_name,
+            routine,
+            wind_forecast,
+            class_session,
+            adjustments,
+            present_count,
+            total_count,
         )
 
         return WorkoutPlan(
-            date=target_date.isoformat(),
+            date=iso_date,
             routine=routine,
             wind_forecast=wind_forecast,
             class_session=class_session,
-            recommended_adjustments=adjustments,
+            recommended_adjustments=tuple(adjustments),
             plan_summary=plan_summary,
         )
 
@@ -83,55 +143,54 @@ class WorkoutPlannerService:
         routine: WorkoutRoutine,
         wind_forecast: WindForcast,
         class_session: ClassSession | None,
-    ) -> list[str]:
-        """Generate workout adjustments based on conditions."""
+    ) -> tuple[list[str], int, int]:
+        """Generate workout adjustments based on conditions.
+
+        Returns the adjustments along with the class present and total counts
+        (both 0 when there is no class session).
+        """
         adjustments = []
+        present_count = total_count = 0
 
         # Weather-based adjustments
-        if wind_forecast.wind_speed_mps > 10:
+        if wind_forecast.wind_speed_mps > self.HIGH_WIND_MPS:
             adjustments.append(
                 f"⚠️ High wind speed ({wind_forecast.wind_speed_mps} m/s) - "
                 "consider moving outdoor activities indoors"
             )
-        elif wind_forecast.wind_speed_mps > 5:
+        elif wind_forecast.wind_speed_mps > self.MOD_WIND_MPS:
             adjustments.append(
                 f"⚡ Moderate wind ({wind_forecast.wind_speed_mps} m/s) - "
                 "adjust form for exercises, especially standing movements"
             )
 
-        if "rain" in wind_forecast.description.lower():
-            adjustments.append("🌧️ Rainy conditions - ensure proper footwear and safety")
+        desc_lower = wind_forecast.description.lower()
+        if "rain" in desc_lower:
+            adjustments.append(_RAIN_MSG)
 
-        if (
-            "clear" in wind_forecast.description.lower()
-            or "sunny" in wind_forecast.description.lower()
-        ):
-            adjustments.append("☀️ Great weather - consider outdoor cardio session")
+        if "clear" in desc_lower or "sunny" in desc_lower:
+            adjustments.append(_GOOD_WEATHER_MSG)
 
         # Temperature-based adjustments
-        temp = getattr(wind_forecast, "temperature_celsius", None)
+        temp = wind_forecast.temperature_celsius
         if temp is not None:
-            if temp >= 30:
+            if temp >= self.HOT_C:
                 adjustments.append(
                     f"🔥 High temperature ({temp}°C) - shorten outdoor cardio and hydrate"
                 )
-            elif temp <= 5:
+            elif temp <= self.COLD_C:
                 adjustments.append(
                     f"❄️ Low temperature ({temp}°C) - layer up and consider indoor warm-up"
                 )
 
         # Routine intensity adjustments
         if routine.intensity == "High":
-            adjustments.append(
-                "💪 High intensity workout - ensure adequate hydration and recovery"
-            )
+            adjustments.append(_HIGH_INTENSITY_MSG)
 
         # Class roster adjustments
         if class_session:
-            present_count = sum(
-                1 for m in class_session.roster if m.status == "Present"
-            )
-            total_count = len(class_session.roster)
+            present_count = class_session.present_count
+            total_count = class_session.total_count
             if present_count < total_count * 0.5:
                 adjustments.append(
                     f"📊 Low class attendance ({present_count}/{total_count}) - "
@@ -143,9 +202,9 @@ class WorkoutPlannerService:
                 )
 
         if not adjustments:
-            adjustments.append("✨ Optimal conditions - proceed with standard routine")
+            adjustments.append(_OPTIMAL_MSG)
 
-        return adjustments
+        return adjustments, present_count, total_count
 
     def _create_summary(
         self,
@@ -154,33 +213,27 @@ class WorkoutPlannerService:
         wind_forecast: WindForcast,
         class_session: ClassSession | None,
         adjustments: list[str],
+        present_count: int,
+        total_count: int,
     ) -> str:
         """Create a formatted summary of the workout plan."""
         summary_lines = [
-            f"📅 Daily Workout Plan - {day_name}",
-            "=" * 50,
-            f"\n🏋️ Routine: {routine.name}",
-            f"   Duration: {routine.duration_minutes} minutes",
-            f"   Intensity: {routine.intensity}",
-            f"   Exercises: {', '.join(routine.exercises)}",
-            f"\n🌍 Weather ({wind_forecast.location}):",
-            f"   Wind Speed: {wind_forecast.wind_speed_mps} m/s",
-            f"   Description: {wind_forecast.description}",
-            f"   Temperature: {getattr(wind_forecast, 'temperature_celsius', 'N/A')} °C",
+            self._SUMMARY_HEADER.format(
+                day_name=day_name,
+                routine=routine,
+                wind_forecast=wind_forecast,
+            )
         ]
 
         if wind_forecast.wind_gust_mps:
             summary_lines.append(f"   Wind Gust: {wind_forecast.wind_gust_mps} m/s")
 
         if class_session:
-            present_count = sum(
-                1 for m in class_session.roster if m.status == "Present"
-            )
             summary_lines.extend(
                 [
                     f"\n👥 Class Session: {class_session.class_name}",
                     f"   Time: {class_session.time}",
-                    f"   Attendance: {present_count}/{len(class_session.roster)} members present",
+                    f"   Attendance: {present_count}/{total_count} members present",
                 ]
             )
 
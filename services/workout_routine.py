@@ -1,19 +1,29 @@
 from __future__ import annotations
 
-import json
-from dataclasses import dataclass
+import threading
+from dataclasses import dataclass, field
 from datetime import date
 from pathlib import Path
 from typing import Any
 
+from services._configcache import load_json
+from services.weekdays import WEEKDAY_INDEX, WEEKDAYS
 
-@dataclass
+
+@dataclass(slots=True)
 class WorkoutRoutine:
     day: str  # Monday, Tuesday, etc.
     name: str
-    exercises: list[str]
+    exercises: tuple[str, ...]
     duration_minutes: int
     intensity: str  # Low, Medium, High
+    # exercises pre-joined for display; derived, never passed in
+    exercises_csv: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Routines are shared between callers, so keep exercises immutable
+        self.exercises = tuple(self.exercises)
+        self.exercises_csv = ", ".join(self.exercises)
 
 
 class WorkoutRoutineService:
@@ -29,34 +39,43 @@ class WorkoutRoutineService:
         self.config_path = Path(config_path)
         self.templates: dict[str, dict[str, Any]] = {}
         self.weekday_map: dict[str, str] = {}
-        self._load_templates()
+        self._by_weekday: list[WorkoutRoutine | None] = [None] * 7
+        # Templates are read on first lookup, not at construction
+        self._loaded = False
+        self._load_lock = threading.Lock()
+
+    def _ensure_loaded(self) -> None:
+        if self._loaded:
+            return
+        with self._load_lock:
+            if self._loaded:
+                return
+            self._load_templates()
+            self._build_weekday_routines()
+            self._loaded = True
+
+    def _build_weekday_routines(self) -> None:
+        # Templates are immutable after loading, so build each weekday's routine
+        # once and serve it by `date.weekday()` index.
+        for i, day in enumerate(WEEKDAYS):
+            key = self.weekday_map.get(day)
+            template = self.templates.get(key) if key else None
+            if template:
+                self._by_weekday[i] = self._build_routine_from_template(day, template)
 
     def _load_templates(self) -> None:
-        if not self.config_path.exists():
+        raw = load_json(str(self.config_path))
+        if not isinstance(raw, dict):
             # Leave templates empty; callers should handle None returns.
             return
 
-        try:
-            raw = json.loads(self.config_path.read_text(encoding="utf-8"))
-        except Exception:
-            raw = {}
-
         # Expect raw to be a dict of numeric-string keys to template dicts
         # e.g., {"1": {...}, "2": {...}}
         self.templates = {k: v for k, v in raw.items() if isinstance(v, dict)}
 
         # Build weekday -> template key mapping
         keys = sorted(self.templates.keys(), key=lambda x: int(x) if x.isdigit() else x)
-        weekdays = [
-            "Monday",
-            "Tuesday",
-            "Wednesday",
-            "Thursday",
-            "Friday",
-            "Saturday",
-            "Sunday",
-        ]
-        for i, day in enumerate(weekdays):
+        for i, day in enumerate(WEEKDAYS):
             if i < len(keys):
                 self.weekday_map[day] = keys[i]
             else:
@@ -87,23 +106,19 @@ class WorkoutRoutineService:
         Returns:
             WorkoutRoutine or None if templates not available
         """
-        key = self.weekday_map.get(day_name)
-        if not key:
-            return None
-        template = self.templates.get(key)
-        if not template:
-            return None
-        return self._build_routine_from_template(day_name, template)
+        self._ensure_loaded()
+        idx = WEEKDAY_INDEX.get(day_name)
+        return self._by_weekday[idx] if idx is not None else None
 
     def get_routine_for_date(self, target_date: date) -> WorkoutRoutine | None:
-        day_name = target_date.strftime("%A")
-        return self.get_routine_for_day(day_name)
+        self._ensure_loaded()
+        return self._by_weekday[target_date.weekday()]
 
     def get_all_routines(self) -> dict[str, WorkoutRoutine]:
         """Return a mapping of weekday -> WorkoutRoutine (for available templates)."""
-        result: dict[str, WorkoutRoutine] = {}
-        for day, key in self.weekday_map.items():
-            tpl = self.templates.get(key)
-            if tpl:
-                result[day] = self._build_routine_from_template(day, tpl)
-        return result
+        self._ensure_loaded()
+        return {
+            day: routine
+            for day, routine in zip(WEEKDAYS, self._by_weekday, strict=True)
+            if routine is not None
+        }